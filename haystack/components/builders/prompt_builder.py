@@ -2,12 +2,15 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Set
 
-from jinja2 import Template, meta
+from jinja2 import Environment, Template, meta
 
 from haystack import component, default_to_dict
 
+RUNTIME_TEMPLATE_CACHE_SIZE = 32
+
 
 @component
 class PromptBuilder:
@@ -154,10 +157,19 @@ class PromptBuilder:
         self._variables = variables
         self._required_variables = required_variables
         self.required_variables = required_variables or []
-        self.template = Template(template)
+        # Templates are compiled once here and reused across runs, `run()` only renders them.
+        # Templates passed to `run()` are cached by source, so the same template passed to every run
+        # is only compiled the first time.
+        self._env = Environment()
+        self._runtime_templates: "OrderedDict[str, Template]" = OrderedDict()
+        self.template = self._env.from_string(template)
+        # Templates without any Jinja2 syntax always render to the same string, so we render them only once
+        self._static_prompt: Optional[str] = None
+        if not any(token in template for token in ("{{", "{%", "{#")):
+            self._static_prompt = self.template.render()
         if not variables:
             # infere variables from template
-            ast = self.template.environment.parse(template)
+            ast = self._env.parse(template)
             template_variables = meta.find_undeclared_variables(ast)
             variables = list(template_variables)
 
@@ -183,6 +195,7 @@ class PromptBuilder:
             self, template=self._template_string, variables=self._variables, required_variables=self._required_variables
         )
 
+    @component.mutates()
     @component.output_types(prompt=str)
     def run(self, template: Optional[str] = None, template_variables: Optional[Dict[str, Any]] = None, **kwargs):
         """
@@ -211,13 +224,35 @@ class PromptBuilder:
         template_variables_combined = {**kwargs, **template_variables}
         self._validate_variables(set(template_variables_combined.keys()))
 
+        if self._static_prompt is not None and (template is None or template == self._template_string):
+            return {"prompt": self._static_prompt}
+
         compiled_template = self.template
-        if isinstance(template, str):
-            compiled_template = Template(template)
+        if isinstance(template, str) and template != self._template_string:
+            compiled_template = self._get_runtime_template(template)
 
         result = compiled_template.render(template_variables_combined)
         return {"prompt": result}
 
+    def _get_runtime_template(self, template: str) -> Template:
+        """
+        Returns the compiled version of a template passed to `run()`, compiling it only if it isn't cached.
+
+        :param template:
+            The template string passed to `run()`.
+        :returns:
+            The compiled template.
+        """
+        compiled_template = self._runtime_templates.get(template)
+        if compiled_template is None:
+            compiled_template = self._env.from_string(template)
+            self._runtime_templates[template] = compiled_template
+            if len(self._runtime_templates) > RUNTIME_TEMPLATE_CACHE_SIZE:
+                self._runtime_templates.popitem(last=False)
+        else:
+            self._runtime_templates.move_to_end(template)
+        return compiled_template
+
     def _validate_variables(self, provided_variables: Set[str]):
         """
         Checks if all the required template variables are provided.
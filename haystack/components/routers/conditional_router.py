@@ -2,9 +2,10 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Dict, List, Set
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from jinja2 import Environment, TemplateSyntaxError, meta
+from jinja2 import Environment, Template, TemplateSyntaxError, meta, nodes
 from jinja2.nativetypes import NativeEnvironment
 
 from haystack import component, default_from_dict, default_to_dict, logging
@@ -12,6 +13,10 @@ from haystack.utils import deserialize_type, serialize_type
 
 logger = logging.getLogger(__name__)
 
+# Types whose equality is consistent with their hash and with each other's,
+# values made only of these can be looked up in the equality table of ConditionalRouter
+_LITERAL_TYPES = (str, int, float, bool, type(None))
+
 
 class NoRouteSelectedException(Exception):
     """Exception raised when no route is selected in ConditionalRouter."""
@@ -114,19 +119,22 @@ class ConditionalRouter:
             - `output_name`: The name under which the `output` value of the route is published. This name is used to connect
             the router to other components in the pipeline.
         """
+        # Jinja native environment used to validate and inspect the routes, and to evaluate the condition and
+        # output templates as Python expressions.
+        # Templates are compiled the first time they're evaluated and then reused by all the following runs.
+        self._env = NativeEnvironment()
+        self._compiled_templates: Dict[str, Template] = {}
+
         self._validate_routes(routes)
         self.routes: List[dict] = routes
 
-        # Create a Jinja native environment to inspect variables in the condition templates
-        env = NativeEnvironment()
-
         # Inspect the routes to determine input and output types.
         input_types: Set[str] = set()  # let's just store the name, type will always be Any
         output_types: Dict[str, str] = {}
 
         for route in routes:
             # extract inputs
-            route_input_names = self._extract_variables(env, [route["output"], route["condition"]])
+            route_input_names = self._extract_variables(self._env, [route["output"], route["condition"]])
             input_types.update(route_input_names)
 
             # extract outputs
@@ -135,6 +143,25 @@ class ConditionalRouter:
         component.set_input_types(self, **{var: Any for var in input_types})
         component.set_output_types(self, **output_types)
 
+        # When all the conditions compare the same variable to a list literal the route can be found
+        # with a dictionary lookup, without evaluating the conditions one by one
+        self._eq_table = self._build_eq_table(routes)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Compiled Jinja templates can't be pickled nor deep-copied, they're compiled again when needed
+        state = self.__dict__.copy()
+        state["_compiled_templates"] = {}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ConditionalRouter":
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        copied.__setstate__(deepcopy(self.__getstate__(), memo))
+        return copied
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Serializes the component to a dictionary.
@@ -181,15 +208,20 @@ class ConditionalRouter:
         :raises NoRouteSelectedException: If no `condition' in the routes is `True`.
         :raises RouteConditionException: If there is an error parsing or evaluating the `condition` expression in the routes.
         """
-        # Create a Jinja native environment to evaluate the condition templates as Python expressions
-        env = NativeEnvironment()
+        route = self._lookup_eq_table(kwargs)
+        if route is not None:
+            try:
+                output = self._compile_template(route["output"]).render(**kwargs)
+            except Exception as e:
+                raise RouteConditionException(f"Error evaluating condition for route '{route}': {e}") from e
+            return {route["output_name"]: output}
 
         for route in self.routes:
             try:
-                t = env.from_string(route["condition"])
+                t = self._compile_template(route["condition"])
                 if t.render(**kwargs):
                     # We now evaluate the `output` expression to determine the route output
-                    t_output = env.from_string(route["output"])
+                    t_output = self._compile_template(route["output"])
                     output = t_output.render(**kwargs)
                     # and return the output as a dictionary under the output_name key
                     return {route["output_name"]: output}
@@ -198,13 +230,78 @@ class ConditionalRouter:
 
         raise NoRouteSelectedException(f"No route fired. Routes: {self.routes}")
 
+    def _build_eq_table(self, routes: List[Dict]) -> Optional[Tuple[str, Dict[Tuple[Any, ...], Dict]]]:
+        """
+        Builds a lookup table of the routes if all their conditions are like `{{ variable == [literal, ...] }}`.
+
+        :param routes: A list of routes.
+        :returns:
+            A tuple with the name of the compared variable and a dictionary mapping the compared literals, as tuples,
+            to the first route comparing the variable to them. `None` if any condition has a different shape.
+        """
+        variable = None
+        table: Dict[Tuple[Any, ...], Dict] = {}
+        for route in routes:
+            body = self._env.parse(route["condition"]).body
+            if len(body) != 1 or not isinstance(body[0], nodes.Output) or len(body[0].nodes) != 1:
+                return None
+            compare = body[0].nodes[0]
+            if not (
+                isinstance(compare, nodes.Compare)
+                and isinstance(compare.expr, nodes.Name)
+                and len(compare.ops) == 1
+                and compare.ops[0].op == "eq"
+                and isinstance(compare.ops[0].expr, nodes.List)
+                and all(
+                    isinstance(item, nodes.Const) and type(item.value) in _LITERAL_TYPES
+                    for item in compare.ops[0].expr.items
+                )
+            ):
+                return None
+            if variable is not None and compare.expr.name != variable:
+                return None
+            variable = compare.expr.name
+            table.setdefault(tuple(item.value for item in compare.ops[0].expr.items), route)
+        if variable is None:
+            return None
+        return variable, table
+
+    def _lookup_eq_table(self, kwargs: Dict[str, Any]) -> Optional[Dict]:
+        """
+        Looks up the route to select in the equality table.
+
+        :param kwargs: The inputs of the router.
+        :returns:
+            The route whose condition is `True`, or `None` if there's no table, the input can't be looked up in it
+            or no route matches. In these cases the conditions must be evaluated one by one.
+        """
+        if self._eq_table is None:
+            return None
+        variable, table = self._eq_table
+        value = kwargs.get(variable)
+        if type(value) is not list or not all(type(item) in _LITERAL_TYPES for item in value):
+            return None
+        return table.get(tuple(value))
+
+    def _compile_template(self, template_text: str) -> Template:
+        """
+        Returns the compiled version of a template, compiling it only the first time it's seen.
+
+        :param template_text: A Jinja template string.
+        :returns: The compiled template.
+        """
+        template = self._compiled_templates.get(template_text)
+        if template is None:
+            template = self._env.from_string(template_text)
+            self._compiled_templates[template_text] = template
+        return template
+
     def _validate_routes(self, routes: List[Dict]):
         """
         Validates a list of routes.
 
         :param routes: A list of routes.
         """
-        env = NativeEnvironment()
         for route in routes:
             try:
                 keys = set(route.keys())
@@ -218,7 +315,7 @@ class ConditionalRouter:
                     f"Route must contain 'condition', 'output', 'output_type' and 'output_name' fields: {route}"
                 )
             for field in ["condition", "output"]:
-                if not self._validate_template(env, route[field]):
+                if not self._validate_template(self._env, route[field]):
                     raise ValueError(f"Invalid template for field '{field}': {route[field]}")
 
     def _extract_variables(self, env: NativeEnvironment, templates: List[str]) -> Set[str]:
@@ -280,7 +280,8 @@ class _Component:
         """
         if not hasattr(instance, "__haystack_input__"):
             instance.__haystack_input__ = Sockets(instance, {}, InputSocket)
-        instance.__haystack_input__[name] = InputSocket(name=name, type=type, default_value=default)
+        socket = InputSocket(name=name, type=type, default_value=default)
+        instance.__haystack_input__[socket.name] = socket
 
     def set_input_types(self, instance, **types):
         """
@@ -383,6 +384,45 @@ class _Component:
 
         return output_types_decorator
 
+    def mutates(self, *names: str):
+        """
+        Decorator factory that declares which inputs a component modifies in place.
+
+        By default a Pipeline deep-copies every input it receives from the user before passing it to a component,
+        so that the same object passed to multiple components can't be changed by one of them behind the back
+        of the others. Components decorated with `mutates` declare the complete list of inputs they modify:
+        only those are deep-copied. The other inputs are not deep-copied, the component receives a shallow copy
+        of them, so for example the items of a list are the same objects the user passed.
+
+        Use as:
+
+        ```python
+        @component
+        class MyComponent:
+            @component.mutates("documents")
+            @component.output_types(documents=List[Document])
+            def run(self, documents: List[Document], query: str):
+                documents.append(Document(content=query))
+                return {"documents": documents}
+        ```
+
+        Calling it without any name declares that the component doesn't modify any of its inputs.
+        Declaring a name that is not an input of the component makes the Pipeline raise a `ComponentError`.
+        A component must never return the inputs it doesn't declare as mutated as part of its outputs.
+        """
+
+        def mutates_decorator(run_method):
+            """
+            Decorator that stores the names of the inputs the decorated method modifies.
+
+            As with `output_types`, this happens at class creation time so the names are stored
+            as an attribute of the decorated method.
+            """
+            setattr(run_method, "_mutated_inputs", frozenset(names))
+            return run_method
+
+        return mutates_decorator
+
     def _component(self, cls, is_greedy: bool = False):
         """
         Decorator validating the structure of the component and registering it in the components registry.
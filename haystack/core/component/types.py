@@ -7,6 +7,8 @@ from typing import Any, Iterable, List, Type, TypeVar, get_args
 
 from typing_extensions import Annotated, TypeAlias  # Python 3.8 compatibility
 
+from haystack.core.type_utils import _intern
+
 HAYSTACK_VARIADIC_ANNOTATION = "__haystack__variadic_t"
 
 # # Generic type variable used in the Variadic container
@@ -53,6 +55,7 @@ class InputSocket:
         return self.default_value == _empty
 
     def __post_init__(self):
+        self.name = _intern(self.name)
         try:
             # __metadata__ is a tuple
             self.is_variadic = self.type.__metadata__[0] == HAYSTACK_VARIADIC_ANNOTATION
@@ -92,3 +95,6 @@ class OutputSocket:
     name: str
     type: type
     receivers: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.name = _intern(self.name)
@@ -22,12 +22,13 @@ from haystack.core.errors import (
     PipelineValidationError,
 )
 from haystack.core.serialization import DeserializationCallbacks, component_from_dict, component_to_dict
-from haystack.core.type_utils import _type_name, _types_are_compatible
+from haystack.core.type_utils import _intern, _type_name, _types_are_compatible
 from haystack.marshal import Marshaller, YamlMarshaller
 from haystack.utils import is_in_jupyter
 
 from .descriptions import find_pipeline_inputs, find_pipeline_outputs
 from .draw import _to_mermaid_image
+from .schedule import ScheduleStep, build_schedule
 from .template import PipelineTemplate, PredefinedPipeline
 from .utils import parse_connect_string
 
@@ -73,6 +74,8 @@ class PipelineBase:
         self.graph = networkx.MultiDiGraph()
         self._debug: Dict[int, Dict[str, Any]] = {}
         self._debug_path = Path(debug_path)
+        # Built lazily by `_get_schedule()` and reset whenever the graph changes
+        self._schedule: Optional[Dict[str, ScheduleStep]] = None
 
     def __eq__(self, other) -> bool:
         """
@@ -295,6 +298,8 @@ class PipelineBase:
             )
             raise PipelineError(msg)
 
+        name = _intern(name)
+
         setattr(instance, "__haystack_added_to_pipeline__", self)
 
         # Add component to the graph, disconnected
@@ -307,6 +312,7 @@ class PipelineBase:
             output_sockets=instance.__haystack_output__._sockets_dict,  # type: ignore[attr-defined]
             visits=0,
         )
+        self._schedule = None
 
     def connect(self, sender: str, receiver: str) -> "PipelineBase":
         """
@@ -472,6 +478,7 @@ class PipelineBase:
             to_socket=receiver_socket,
             mandatory=receiver_socket.is_mandatory,
         )
+        self._schedule = None
         return self
 
     def get_component(self, name: str) -> Component:
@@ -619,26 +626,30 @@ class PipelineBase:
         :raises ValueError:
             If inputs are invalid according to the above.
         """
+        # What each Component accepts only depends on the graph, so it's taken from the schedule
+        schedule = self._get_schedule()
         for component_name, component_inputs in data.items():
-            if component_name not in self.graph.nodes:
+            if component_name not in schedule:
                 raise ValueError(f"Component named {component_name} not found in the pipeline.")
-            instance = self.graph.nodes[component_name]["instance"]
-            for socket_name, socket in instance.__haystack_input__._sockets_dict.items():
-                if socket.senders == [] and socket.is_mandatory and socket_name not in component_inputs:
+            step = schedule[component_name]
+            for socket_name in step.required_inputs:
+                if socket_name not in component_inputs:
                     raise ValueError(f"Missing input for component {component_name}: {socket_name}")
+            sockets = step.instance.__haystack_input__._sockets_dict  # type: ignore[attr-defined]
             for input_name in component_inputs.keys():
-                if input_name not in instance.__haystack_input__._sockets_dict:
+                if input_name not in sockets:
                     raise ValueError(f"Input {input_name} not found in component {component_name}.")
 
-        for component_name in self.graph.nodes:
-            instance = self.graph.nodes[component_name]["instance"]
-            for socket_name, socket in instance.__haystack_input__._sockets_dict.items():
-                component_inputs = data.get(component_name, {})
-                if socket.senders == [] and socket.is_mandatory and socket_name not in component_inputs:
+        for component_name, step in schedule.items():
+            component_inputs = data.get(component_name, {})
+            for socket_name in step.required_inputs:
+                if socket_name not in component_inputs:
                     raise ValueError(f"Missing input for component {component_name}: {socket_name}")
-                if socket.senders and socket_name in component_inputs and not socket.is_variadic:
+            for socket_name in step.connected_inputs:
+                if socket_name in component_inputs:
+                    senders = step.instance.__haystack_input__._sockets_dict[socket_name].senders  # type: ignore
                     raise ValueError(
-                        f"Input {socket_name} for component {component_name} is already sent by {socket.senders}."
+                        f"Input {socket_name} for component {component_name} is already sent by {senders}."
                     )
 
     def _prepare_component_input_data(self, data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
@@ -646,7 +657,8 @@ class PipelineBase:
         Prepares input data for pipeline components.
 
         Organizes input data for pipeline components and identifies any inputs that are not matched to any
-        component's input slots. Deep-copies data items to avoid sharing mutables across multiple components.
+        component's input slots. Deep-copies data items to avoid sharing mutables across multiple components,
+        unless a component declared with `component.mutates` that it doesn't modify them.
 
         This method processes a flat dictionary of input data, where each key-value pair represents an input name
         and its corresponding value. It distributes these inputs to the appropriate pipeline components based on
@@ -669,7 +681,7 @@ class PipelineBase:
             unresolved_kwargs = {}
 
             # Retrieve the input slots for each component in the pipeline
-            available_inputs: Dict[str, Dict[str, Any]] = self.inputs()
+            available_inputs = {name: step.open_inputs for name, step in self._get_schedule().items()}
 
             # Go through all provided to distribute them to the appropriate component inputs
             for input_name, input_value in data.items():
@@ -695,8 +707,15 @@ class PipelineBase:
 
         # deepcopying the inputs prevents the Pipeline run logic from being altered unexpectedly
         # when the same input reference is passed to multiple components.
+        # Components that declared which inputs they modify get a copy of those inputs only.
+        schedule = self._get_schedule()
         for component_name, component_inputs in data.items():
-            data[component_name] = {k: deepcopy(v) for k, v in component_inputs.items()}
+            step = schedule.get(component_name)
+            mutated_inputs = step.mutated_inputs if step else None
+            data[component_name] = {
+                k: deepcopy(v) if mutated_inputs is None or k in mutated_inputs else v
+                for k, v in component_inputs.items()
+            }
 
         return data
 
@@ -715,27 +734,25 @@ class PipelineBase:
                     # We don't want to force the user to always pass lists, so we convert single values to lists here.
                     # If it's already a list we assume the component takes a variadic input of lists, so we
                     # convert it in any case.
-                    data[component_name][component_input] = [input_value]
+                    data[component_name][component_input] = [data[component_name][component_input]]
 
         return {**data}
 
     def _init_to_run(self) -> List[Tuple[str, Component]]:
-        to_run: List[Tuple[str, Component]] = []
-        for node_name in self.graph.nodes:
-            component = self.graph.nodes[node_name]["instance"]
+        # Take all components that have at least 1 input not connected or is variadic,
+        # and all components that have no inputs at all
+        return [(name, step.instance) for name, step in self._get_schedule().items() if step.runs_first]
 
-            if len(component.__haystack_input__._sockets_dict) == 0:
-                # Component has no input, can run right away
-                to_run.append((node_name, component))
-                continue
-
-            for socket in component.__haystack_input__._sockets_dict.values():
-                if not socket.senders or socket.is_variadic:
-                    # Component has at least one input not connected or is variadic, can run right away.
-                    to_run.append((node_name, component))
-                    break
+    def _get_schedule(self) -> Dict[str, ScheduleStep]:
+        """
+        Returns the schedule of this Pipeline, building it if the graph changed since the last time it was built.
 
-        return to_run
+        :returns:
+            A dictionary of `ScheduleStep`s keyed by Component name.
+        """
+        if self._schedule is None:
+            self._schedule = build_schedule(self.graph)
+        return self._schedule
 
     @classmethod
     def from_template(
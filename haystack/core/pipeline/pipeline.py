@@ -2,8 +2,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from collections import deque
 from copy import deepcopy
-from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Mapping, Optional, Set, Tuple
 
 from haystack import logging, tracing
 from haystack.core.component import Component
@@ -112,9 +113,15 @@ class Pipeline(PipelineBase):
         # Initialize the inputs state
         last_inputs: Dict[str, Dict[str, Any]] = self._init_inputs_state(data)
 
+        # Everything that only depends on the graph topology is computed once and reused across runs
+        schedule = self._get_schedule()
+
         # Take all components that have at least 1 input not connected or is variadic,
         # and all components that have no inputs at all
-        to_run: List[Tuple[str, Component]] = self._init_to_run()
+        to_run: Deque[Tuple[str, Component]] = deque(self._init_to_run())
+        # Names of the Components in `to_run`, kept in sync with it for constant time membership checks.
+        # A Component is never enqueued twice so the names are unique.
+        to_run_names: Set[str] = {name for name, _ in to_run}
 
         # These variables are used to detect when we're stuck in a loop.
         # Stuck loops can happen when one or more components are waiting for input but
@@ -147,14 +154,13 @@ class Pipeline(PipelineBase):
             extra_outputs: Dict[Any, Any] = {}
 
             while len(to_run) > 0:
-                name, comp = to_run.pop(0)
+                name, comp = to_run.popleft()
+                to_run_names.discard(name)
 
-                if any(socket.is_variadic for socket in comp.__haystack_input__._sockets_dict.values()) and not getattr(  # type: ignore
-                    comp, "is_greedy", False
-                ):
+                if schedule[name].is_variadic and not getattr(comp, "is_greedy", False):
                     there_are_non_variadics = False
-                    for _, other_comp in to_run:
-                        if not any(socket.is_variadic for socket in other_comp.__haystack_input__._sockets_dict.values()):  # type: ignore
+                    for other_name, _ in to_run:
+                        if not schedule[other_name].is_variadic:
                             there_are_non_variadics = True
                             break
 
@@ -176,20 +182,8 @@ class Pipeline(PipelineBase):
                             "haystack.component.input_types": {
                                 k: type(v).__name__ for k, v in last_inputs[name].items()
                             },
-                            "haystack.component.input_spec": {
-                                key: {
-                                    "type": value.type.__name__ if isinstance(value.type, type) else str(value.type),
-                                    "senders": value.senders,
-                                }
-                                for key, value in comp.__haystack_input__._sockets_dict.items()  # type: ignore
-                            },
-                            "haystack.component.output_spec": {
-                                key: {
-                                    "type": value.type.__name__ if isinstance(value.type, type) else str(value.type),
-                                    "senders": value.receivers,
-                                }
-                                for key, value in comp.__haystack_output__._sockets_dict.items()  # type: ignore
-                            },
+                            "haystack.component.input_spec": schedule[name].input_spec,
+                            "haystack.component.output_spec": schedule[name].output_spec,
                         },
                     ) as span:
                         span.set_content_tag("haystack.component.input", last_inputs[name])
@@ -224,50 +218,52 @@ class Pipeline(PipelineBase):
                     # This is done after the output has been distributed to the next components, so that
                     # we're sure all components that need this output have received it.
                     to_remove_from_res = set()
-                    for sender_component_name, receiver_component_name, edge_data in self.graph.edges(data=True):
-                        if receiver_component_name == name and edge_data["to_socket"].is_variadic:
+                    for sender_component_name, receiver_component_name, from_socket, to_socket in schedule[name].edges:
+                        if receiver_component_name == name and to_socket.is_variadic:
                             # Delete variadic inputs that were already consumed
-                            last_inputs[name][edge_data["to_socket"].name] = []
+                            last_inputs[name][to_socket.name] = []
 
                         if name != sender_component_name:
                             continue
 
-                        if edge_data["from_socket"].name not in res:
+                        if from_socket.name not in res:
                             # This output has not been produced by the component, skip it
                             continue
 
                         if receiver_component_name not in last_inputs:
                             last_inputs[receiver_component_name] = {}
-                        to_remove_from_res.add(edge_data["from_socket"].name)
-                        value = res[edge_data["from_socket"].name]
+                        to_remove_from_res.add(from_socket.name)
+                        value = res[from_socket.name]
 
-                        if edge_data["to_socket"].is_variadic:
-                            if edge_data["to_socket"].name not in last_inputs[receiver_component_name]:
-                                last_inputs[receiver_component_name][edge_data["to_socket"].name] = []
+                        if to_socket.is_variadic:
+                            if to_socket.name not in last_inputs[receiver_component_name]:
+                                last_inputs[receiver_component_name][to_socket.name] = []
                             # Add to the list of variadic inputs
-                            last_inputs[receiver_component_name][edge_data["to_socket"].name].append(value)
+                            last_inputs[receiver_component_name][to_socket.name].append(value)
                         else:
-                            last_inputs[receiver_component_name][edge_data["to_socket"].name] = value
+                            last_inputs[receiver_component_name][to_socket.name] = value
 
-                        pair = (receiver_component_name, self.graph.nodes[receiver_component_name]["instance"])
-                        is_greedy = pair[1].__haystack_is_greedy__
-                        is_variadic = edge_data["to_socket"].is_variadic
+                        pair = (receiver_component_name, schedule[receiver_component_name].instance)
+                        is_greedy = schedule[receiver_component_name].is_greedy
+                        is_variadic = to_socket.is_variadic
                         if is_variadic and is_greedy:
                             # If the receiver is greedy, we can run it right away.
                             # First we remove it from the lists it's in if it's there or we risk running it multiple times.
-                            if pair in to_run:
+                            if receiver_component_name in to_run_names:
                                 to_run.remove(pair)
                             if pair in waiting_for_input:
                                 waiting_for_input.remove(pair)
                             to_run.append(pair)
+                            to_run_names.add(receiver_component_name)
 
-                        if pair not in waiting_for_input and pair not in to_run:
+                        if pair not in waiting_for_input and receiver_component_name not in to_run_names:
                             to_run.append(pair)
+                            to_run_names.add(receiver_component_name)
 
-                    res = {k: v for k, v in res.items() if k not in to_remove_from_res}
-
-                    if len(res) > 0:
-                        final_outputs[name] = res
+                    # Outputs are passed to the receivers as they are, the only copy made is the one of the
+                    # outputs that nobody received. Components whose outputs were all received skip it.
+                    if len(to_remove_from_res) < len(res):
+                        final_outputs[name] = {k: v for k, v in res.items() if k not in to_remove_from_res}
                 else:
                     # This component doesn't have enough inputs so we can't run it yet
                     if (name, comp) not in waiting_for_input:
@@ -286,11 +282,8 @@ class Pipeline(PipelineBase):
                         # This is our last resort, if there's no lazy variadic or component with only default inputs waiting for input
                         # we're stuck for real and we can't make any progress.
                         for name, comp in waiting_for_input:
-                            is_variadic = any(socket.is_variadic for socket in comp.__haystack_input__._sockets_dict.values())  # type: ignore
-                            has_only_defaults = all(
-                                not socket.is_mandatory for socket in comp.__haystack_input__._sockets_dict.values()  # type: ignore
-                            )
-                            if is_variadic and not comp.__haystack_is_greedy__ or has_only_defaults:  # type: ignore[attr-defined]
+                            step = schedule[name]
+                            if step.is_variadic and not step.is_greedy or step.has_only_defaults:
                                 break
                         else:
                             # We're stuck in a loop for real, we can't make any progress.
@@ -307,6 +300,7 @@ class Pipeline(PipelineBase):
                         # There was a lazy variadic or a component with only default waiting for input, we can run it
                         waiting_for_input.remove((name, comp))
                         to_run.append((name, comp))
+                        to_run_names.add(name)
 
                         # Let's use the default value for the inputs that are still missing, or the component
                         # won't run and will be put back in the waiting list, causing an infinite loop.
@@ -329,17 +323,14 @@ class Pipeline(PipelineBase):
                             last_inputs[name] = {}
 
                         # Lazy variadics must be removed only if there's nothing else to run at this stage
-                        is_variadic = any(socket.is_variadic for socket in comp.__haystack_input__._sockets_dict.values())  # type: ignore
-                        if is_variadic and not comp.__haystack_is_greedy__:  # type: ignore[attr-defined]
+                        step = schedule[name]
+                        if step.is_variadic and not step.is_greedy:
                             there_are_only_lazy_variadics = True
-                            for other_name, other_comp in waiting_for_input:
+                            for other_name, _ in waiting_for_input:
                                 if name == other_name:
                                     continue
                                 there_are_only_lazy_variadics &= (
-                                    any(
-                                        socket.is_variadic for socket in other_comp.__haystack_input__._sockets_dict.values()  # type: ignore
-                                    )
-                                    and not other_comp.__haystack_is_greedy__  # type: ignore[attr-defined]
+                                    schedule[other_name].is_variadic and not schedule[other_name].is_greedy
                                 )
 
                             if not there_are_only_lazy_variadics:
@@ -351,17 +342,12 @@ class Pipeline(PipelineBase):
                         # enqueue the Components in `to_run` at the start using the order they are added in the Pipeline.
                         # If a Component A with defaults is added before a Component B that has no defaults, but in the Pipeline
                         # logic A must be executed after B it could run instead before if we don't do this check.
-                        has_only_defaults = all(
-                            not socket.is_mandatory for socket in comp.__haystack_input__._sockets_dict.values()  # type: ignore
-                        )
-                        if has_only_defaults:
+                        if step.has_only_defaults:
                             there_are_only_components_with_defaults = True
-                            for other_name, other_comp in waiting_for_input:
+                            for other_name, _ in waiting_for_input:
                                 if name == other_name:
                                     continue
-                                there_are_only_components_with_defaults &= all(
-                                    not s.is_mandatory for s in other_comp.__haystack_input__._sockets_dict.values()  # type: ignore
-                                )
+                                there_are_only_components_with_defaults &= schedule[other_name].has_only_defaults
                             if not there_are_only_components_with_defaults:
                                 continue
 
@@ -381,6 +367,7 @@ class Pipeline(PipelineBase):
 
                     waiting_for_input.remove((name, comp))
                     to_run.append((name, comp))
+                    to_run_names.add(name)
 
             if len(include_outputs_from) > 0:
                 for name, output in extra_outputs.items():
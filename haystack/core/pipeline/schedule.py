@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
+
+import networkx  # type:ignore
+
+from haystack.core.component import Component
+from haystack.core.component.types import InputSocket, OutputSocket
+from haystack.core.errors import ComponentError
+
+# (sender, receiver, from_socket, to_socket)
+ScheduleEdge = Tuple[str, str, OutputSocket, InputSocket]
+
+
+@dataclass(frozen=True)
+class ScheduleStep:
+    """
+    Precomputed, run-independent information about a single Component of a Pipeline.
+
+    :param instance:
+        The Component instance.
+    :param edges:
+        The edges `Pipeline.run()` must visit after this Component ran, in graph order.
+        These are all the outgoing edges of the Component plus its incoming variadic edges,
+        as the latter must be reset once their inputs have been consumed.
+    :param is_variadic:
+        Whether the Component has at least one variadic input.
+    :param is_greedy:
+        Whether the Component is greedy.
+    :param has_only_defaults:
+        Whether all the inputs of the Component have a default value.
+    :param runs_first:
+        Whether the Component must be enqueued at the start of the run, that is if it has no inputs,
+        at least one input not connected or at least one variadic input.
+    :param input_spec:
+        Description of the Component input sockets, used to tag its tracing spans.
+    :param output_spec:
+        Description of the Component output sockets, used to tag its tracing spans.
+    :param mutated_inputs:
+        Names of the inputs the Component declared to modify with `component.mutates`,
+        `None` if it didn't declare anything.
+    :param open_inputs:
+        Names of the inputs that can be given to `Pipeline.run()`, that is those not connected or variadic.
+    :param required_inputs:
+        Names of the mandatory inputs that are not connected, these must be given to `Pipeline.run()`.
+    :param connected_inputs:
+        Names of the non variadic inputs that are connected, these can't be given to `Pipeline.run()`.
+    """
+
+    instance: Component
+    edges: Tuple[ScheduleEdge, ...]
+    is_variadic: bool
+    is_greedy: bool
+    has_only_defaults: bool
+    runs_first: bool
+    input_spec: Dict[str, Dict[str, Any]]
+    output_spec: Dict[str, Dict[str, Any]]
+    mutated_inputs: Optional[FrozenSet[str]]
+    open_inputs: Tuple[str, ...]
+    required_inputs: Tuple[str, ...]
+    connected_inputs: Tuple[str, ...]
+
+
+def build_schedule(graph: networkx.MultiDiGraph) -> Dict[str, ScheduleStep]:
+    """
+    Builds the schedule of a Pipeline graph.
+
+    The schedule only depends on the graph topology, so it can be computed once and reused by every run
+    until a Component is added or a new connection is made.
+
+    :param graph:
+        The Pipeline graph.
+    :returns:
+        A dictionary of `ScheduleStep`s keyed by Component name, in the order the Components were added.
+    :raises ComponentError:
+        If a Component declares with `component.mutates` an input it doesn't have.
+    """
+    # Edges are collected in graph order, as the order in which variadic inputs are reset
+    # and outputs are distributed affects what the receivers get.
+    edges: Dict[str, List[ScheduleEdge]] = {name: [] for name in graph.nodes}
+    for sender, receiver, edge_data in graph.edges(data=True):
+        edge = (sender, receiver, edge_data["from_socket"], edge_data["to_socket"])
+        edges[sender].append(edge)
+        if edge_data["to_socket"].is_variadic and receiver != sender:
+            edges[receiver].append(edge)
+
+    schedule = {}
+    for name, instance in graph.nodes(data="instance"):
+        sockets = instance.__haystack_input__._sockets_dict.values()  # type: ignore[attr-defined]
+        mutated_inputs = getattr(instance.run, "_mutated_inputs", None)
+        if mutated_inputs is not None:
+            # A misspelled name would silently disable the deep copy of the input it was meant to declare
+            unknown_inputs = mutated_inputs - {socket.name for socket in sockets}
+            if unknown_inputs:
+                unknown = ", ".join(sorted(unknown_inputs))
+                raise ComponentError(f"Component '{name}' declares it mutates inputs it doesn't have: {unknown}")
+        schedule[name] = ScheduleStep(
+            instance=instance,
+            edges=tuple(edges[name]),
+            is_variadic=any(socket.is_variadic for socket in sockets),
+            is_greedy=getattr(instance, "__haystack_is_greedy__", False),
+            has_only_defaults=all(not socket.is_mandatory for socket in sockets),
+            runs_first=len(sockets) == 0 or any(not socket.senders or socket.is_variadic for socket in sockets),
+            input_spec={
+                key: {"type": _socket_type_name(socket), "senders": socket.senders}
+                for key, socket in instance.__haystack_input__._sockets_dict.items()  # type: ignore[attr-defined]
+            },
+            output_spec={
+                key: {"type": _socket_type_name(socket), "senders": socket.receivers}
+                for key, socket in instance.__haystack_output__._sockets_dict.items()  # type: ignore[attr-defined]
+            },
+            mutated_inputs=mutated_inputs,
+            open_inputs=tuple(socket.name for socket in sockets if socket.is_variadic or not socket.senders),
+            required_inputs=tuple(socket.name for socket in sockets if socket.is_mandatory and not socket.senders),
+            connected_inputs=tuple(socket.name for socket in sockets if socket.senders and not socket.is_variadic),
+        )
+    return schedule
+
+
+def _socket_type_name(socket: Union[InputSocket, OutputSocket]) -> str:
+    return socket.type.__name__ if isinstance(socket.type, type) else str(socket.type)
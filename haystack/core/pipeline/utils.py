@@ -4,6 +4,8 @@
 
 from typing import Optional, Tuple
 
+from haystack.core.type_utils import _intern
+
 
 def parse_connect_string(connection: str) -> Tuple[str, Optional[str]]:
     """
@@ -13,8 +15,9 @@ def parse_connect_string(connection: str) -> Tuple[str, Optional[str]]:
         The connection string.
     :returns:
         A tuple containing the component name and the connection name.
+        Both names are interned.
     """
     if "." in connection:
         split_str = connection.split(".", maxsplit=1)
-        return (split_str[0], split_str[1])
-    return connection, None
+        return (_intern(split_str[0]), _intern(split_str[1]))
+    return _intern(connection), None
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import sys
 from typing import Any, Union, get_args, get_origin
 
 from haystack import logging
@@ -82,3 +83,15 @@ def _type_name(type_):
         return f"{name}[{args}]"
 
     return f"{name}"
+
+
+def _intern(name: Any) -> Any:
+    """
+    Interns a component or socket name, so that lookups keyed by it are mostly identity checks.
+
+    `sys.intern` only accepts plain strings: subclasses like `StrEnum` members are interned as their plain string
+    value, that compares and hashes the same, while anything that's not a string is returned unchanged.
+    """
+    if isinstance(name, str):
+        return sys.intern(str.__str__(name))
+    return name
@@ -10,6 +10,7 @@ from pandas import DataFrame, read_json
 
 from haystack.core.serialization import default_from_dict, default_to_dict
 from haystack.dataclasses.document import Document
+from haystack.dataclasses.slots import _add_slots
 
 
 @runtime_checkable
@@ -152,6 +153,7 @@ class ExtractedTableAnswer:
         return default_from_dict(cls, data)
 
 
+@_add_slots
 @dataclass
 class GeneratedAnswer:
     data: str
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Optional
 
+from haystack.dataclasses.slots import _add_slots
+
 
 class ChatRole(str, Enum):
     """Enumeration representing the roles within a chat."""
@@ -16,6 +18,7 @@ class ChatRole(str, Enum):
     FUNCTION = "function"
 
 
+@_add_slots
 @dataclass
 class ChatMessage:
     """
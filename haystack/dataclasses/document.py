@@ -12,6 +12,7 @@ from pandas import DataFrame, read_json
 
 from haystack import logging
 from haystack.dataclasses.byte_stream import ByteStream
+from haystack.dataclasses.slots import _add_slots
 from haystack.dataclasses.sparse_embedding import SparseEmbedding
 
 logger = logging.getLogger(__name__)
@@ -49,6 +50,7 @@ class _BackwardCompatible(type):
         return super().__call__(*args, **kwargs)
 
 
+@_add_slots
 @dataclass
 class Document(metaclass=_BackwardCompatible):
     """
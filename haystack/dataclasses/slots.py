@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from dataclasses import fields
+from typing import Any, Dict, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def _add_slots(cls: Type[T]) -> Type[T]:
+    """
+    Recreates a dataclass so that its fields are stored in `__slots__` instead of an instance `__dict__`.
+
+    This is the equivalent of `@dataclass(slots=True)`, that is only available from Python 3.10.
+    Instances take roughly half the memory and their fields are faster to access, but new attributes
+    can't be set on them anymore. Weak references are still supported.
+    Instances are pickled with a dictionary of their fields as state, the same as before they were slotted,
+    so pickles work across both versions of the class.
+
+    Must be applied on top of `@dataclass`.
+
+    :param cls:
+        The dataclass to recreate.
+    :returns:
+        The new slotted class.
+    """
+    field_names = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    cls_dict = dict(cls.__dict__)
+    # The default values are class attributes that would conflict with the slots,
+    # the dataclass `__init__` has its own reference to them so they can be dropped.
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = field_names + ("__weakref__",)
+    cls_dict["__getstate__"] = _getstate_as_dict
+    cls_dict["__setstate__"] = _setstate_from_dict
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def _getstate_as_dict(self: Any) -> Dict[str, Any]:
+    """
+    Returns the fields of a slotted dataclass instance as its pickled state.
+
+    :returns:
+        A dictionary with the value of each field.
+    """
+    return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+def _setstate_from_dict(self: Any, state: Dict[str, Any]):
+    """
+    Restores the fields of a slotted dataclass instance from its pickled state.
+
+    :param state:
+        A dictionary with the value of each field.
+    """
+    for name, value in state.items():
+        # Goes through `object` in case the dataclass is frozen
+        object.__setattr__(self, name, value)
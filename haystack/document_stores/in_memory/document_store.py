@@ -2,10 +2,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import heapq
 import math
 import re
 import uuid
-from collections import Counter
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
 
@@ -29,6 +30,9 @@ logger = logging.getLogger(__name__)
 BM25_SCALING_FACTOR = 8
 DOT_PRODUCT_SCALING_FACTOR = 100
 
+# Maximum number of BM25 rankings cached by each InMemoryDocumentStore instance.
+BM25_CACHE_SIZE = 256
+
 
 @dataclass
 class BM25DocumentStats:
@@ -46,6 +50,8 @@ class BM25DocumentStats:
 # Global storage for all InMemoryDocumentStore instances, indexed by the index name.
 _STORAGES: Dict[str, Dict[str, Document]] = {}
 _BM25_STATS_STORAGES: Dict[str, Dict[str, BM25DocumentStats]] = {}
+# Revision of each storage, incremented every time documents are written or deleted.
+_STORAGE_REVISIONS: Dict[str, int] = {}
 
 
 class InMemoryDocumentStore:
@@ -99,6 +105,9 @@ class InMemoryDocumentStore:
         if self.index not in _BM25_STATS_STORAGES:
             _BM25_STATS_STORAGES[self.index] = {}
 
+        # BM25 rankings of unfiltered retrievals, keyed by query, top_k and storage revision
+        self._bm25_cache: "OrderedDict[Tuple[str, int, int], List[Tuple[Document, float]]]" = OrderedDict()
+
     @property
     def storage(self) -> Dict[str, Document]:
         """
@@ -106,6 +115,13 @@ class InMemoryDocumentStore:
         """
         return _STORAGES.get(self.index, {})
 
+    @property
+    def _revision(self) -> int:
+        return _STORAGE_REVISIONS.get(self.index, 0)
+
+    def _bump_revision(self) -> None:
+        _STORAGE_REVISIONS[self.index] = self._revision + 1
+
     @property
     def _bm25_attr(self) -> Dict[str, BM25DocumentStats]:
         return _BM25_STATS_STORAGES.get(self.index, {})
@@ -399,6 +415,9 @@ class InMemoryDocumentStore:
             self._bm25_attr[document.id] = BM25DocumentStats(Counter(tokens), len(tokens))
             self._freq_vocab_for_idf.update(set(tokens))
             self._avg_doc_len = (len(tokens) + self._avg_doc_len * len(self._bm25_attr)) / (len(self._bm25_attr) + 1)
+            # Bumped for every document, a batch failing halfway must still invalidate the cached results
+            self._bump_revision()
+
         return written_documents
 
     def delete_documents(self, document_ids: List[str]) -> None:
@@ -422,22 +441,12 @@ class InMemoryDocumentStore:
                 self._avg_doc_len = (self._avg_doc_len * (len(self._bm25_attr) + 1) - doc_len) / len(self._bm25_attr)
             except ZeroDivisionError:
                 self._avg_doc_len = 0
+            self._bump_revision()
 
-    def bm25_retrieval(
-        self, query: str, filters: Optional[Dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
-    ) -> List[Document]:
+    def _bm25_rank(self, query: str, filters: Optional[Dict[str, Any]], top_k: int) -> List[Tuple[Document, float]]:
         """
-        Retrieves documents that are most relevant to the query using BM25 algorithm.
-
-        :param query: The query string.
-        :param filters: A dictionary with filters to narrow down the search space.
-        :param top_k: The number of top documents to retrieve. Default is 10.
-        :param scale_score: Whether to scale the scores of the retrieved documents. Default is False.
-        :returns: A list of the top_k documents most relevant to the query.
+        Scores the documents matching the filters with BM25 and returns the top_k ones with their unscaled score.
         """
-        if not query:
-            raise ValueError("Query should be a non-empty string")
-
         content_type_filter = {
             "operator": "OR",
             "conditions": [
@@ -457,7 +466,34 @@ class InMemoryDocumentStore:
             logger.info("No documents found for BM25 retrieval. Returning empty list.")
             return []
 
-        results = sorted(self.bm25_algorithm_inst(query, all_documents), key=lambda x: x[1], reverse=True)[:top_k]
+        return _top_k_by_score(self.bm25_algorithm_inst(query, all_documents), top_k)
+
+    def bm25_retrieval(
+        self, query: str, filters: Optional[Dict[str, Any]] = None, top_k: int = 10, scale_score: bool = False
+    ) -> List[Document]:
+        """
+        Retrieves documents that are most relevant to the query using BM25 algorithm.
+
+        :param query: The query string.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved documents. Default is False.
+        :returns: A list of the top_k documents most relevant to the query.
+        """
+        if not query:
+            raise ValueError("Query should be a non-empty string")
+
+        # Only unfiltered retrievals are cached, filters are not hashable
+        cache_key = None if filters else (query, top_k, self._revision)
+        results = self._bm25_cache.get(cache_key) if cache_key else None
+        if results is None:
+            results = self._bm25_rank(query=query, filters=filters, top_k=top_k)
+            if cache_key and results:
+                self._bm25_cache[cache_key] = results
+                if len(self._bm25_cache) > BM25_CACHE_SIZE:
+                    self._bm25_cache.popitem(last=False)
+        else:
+            self._bm25_cache.move_to_end(cache_key)  # type: ignore[arg-type]
 
         # BM25Okapi can return meaningful negative values, so they should not be filtered out when scale_score is False.
         # It's the only algorithm supported by rank_bm25 at the time of writing (2024) that can return negative scores.
@@ -523,7 +559,7 @@ class InMemoryDocumentStore:
 
         # create Documents with the similarity score for the top k results
         top_documents = []
-        for doc, score in sorted(zip(documents_with_embeddings, scores), key=lambda x: x[1], reverse=True)[:top_k]:
+        for doc, score in _top_k_by_score(zip(documents_with_embeddings, scores), top_k):
             doc_fields = doc.to_dict()
             doc_fields["score"] = score
             if return_embedding is False:
@@ -582,3 +618,16 @@ class InMemoryDocumentStore:
                 scores = [(score + 1) / 2 for score in scores]
 
         return scores
+
+
+def _top_k_by_score(scored: Iterable[Tuple[Document, float]], top_k: Optional[int]) -> List[Tuple[Document, float]]:
+    """
+    Returns the `top_k` (Document, score) pairs with the highest score, sorted by descending score.
+
+    Documents with the same score keep their relative order, as with a stable sort.
+    Only the top ones are kept while scanning, so this is cheaper than sorting everything when `top_k` is small.
+    """
+    if top_k is None or top_k < 0:
+        # Keep the slicing semantics of `sorted(...)[:top_k]` for these values
+        return sorted(scored, key=lambda x: x[1], reverse=True)[:top_k]
+    return heapq.nlargest(top_k, scored, key=lambda x: x[1])
@@ -2,7 +2,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, List, Optional
+from string import Formatter
+from typing import Any, List, Optional, Tuple
 
 from haystack.core.component import component
 
@@ -19,6 +20,10 @@ class FString:
         if "template" in self.variables:
             raise ValueError("The variable name 'template' is reserved and cannot be used.")
         component.set_input_types(self, **{variable: Any for variable in self.variables})
+        # The template the segments were built from, `self.template` can be reassigned after init
+        # and the segments must then not be used for it
+        self._segments_source = template
+        self._segments = _compile(template)
 
     @component.output_types(string=str)
     def run(self, template: Optional[str] = None, **kwargs):
@@ -29,4 +34,25 @@ class FString:
         """
         if not template:
             template = self.template
+        if self._segments is not None and template == self._segments_source:
+            string = "".join(literal + format(kwargs[var]) if var else literal for literal, var in self._segments)
+            return {"string": string}
         return {"string": template.format(**kwargs)}
+
+
+def _compile(template: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+    """
+    Splits the template in a list of literal text and variable name pairs, so it's parsed only once.
+
+    Returns `None` if the template is malformed or uses anything more than plain `{variable}` fields,
+    like format specs, conversions or attribute access. Those templates are left to `str.format()`.
+    """
+    segments = []
+    try:
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if field_name is not None and (not field_name.isidentifier() or format_spec or conversion):
+                return None
+            segments.append((literal, field_name))
+    except ValueError:
+        return None
+    return segments
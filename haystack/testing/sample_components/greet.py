@@ -43,5 +43,6 @@ class Greet:
         if not level:
             raise ValueError(f"This log level does not exist: {log_level}")
 
-        logger.log(level=level, msg=message.format(value=value))
+        # The message is interpolated by the logger only if the record is actually emitted
+        logger.log(level=level, msg=message, value=value)
         return {"value": value}
@@ -10,6 +10,7 @@ from haystack.core.component.types import Variadic
 
 @component
 class StringJoiner:
+    @component.mutates()
     @component.output_types(output=str)
     def run(self, input_str: Variadic[str]):
         """
@@ -22,6 +23,7 @@ class StringJoiner:
 
 @component
 class StringListJoiner:
+    @component.mutates()
     @component.output_types(output=str)
     def run(self, inputs: Variadic[List[str]]):
         """
@@ -16,7 +16,5 @@ class Parity:  # pylint: disable=too-few-public-methods
         """
         :param value: The value to check for parity
         """
-        remainder = value % 2
-        if remainder:
-            return {"odd": value}
-        return {"even": value}
+        # Indexed by the remainder of the division by 2
+        return {("even", "odd")[value % 2]: value}
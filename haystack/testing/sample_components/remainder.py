@@ -12,11 +12,11 @@ class Remainder:
             raise ValueError("Can't divide by zero")
         self.divisor = divisor
         component.set_output_types(self, **{f"remainder_is_{val}": int for val in range(divisor)})
+        # Output names indexed by the absolute value of the remainder, that has the same sign as the divisor
+        self._outputs = tuple(f"remainder_is_{val if divisor > 0 else -val}" for val in range(abs(divisor)))
 
     def run(self, value: int):
         """
         :param value: the value to check the remainder of.
         """
-        remainder = value % self.divisor
-        output = {f"remainder_is_{remainder}": value}
-        return output
+        return {self._outputs[abs(value % self.divisor)]: value}
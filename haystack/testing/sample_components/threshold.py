@@ -31,6 +31,5 @@ class Threshold:  # pylint: disable=too-few-public-methods
         if threshold is None:
             threshold = self.threshold
 
-        if value < threshold:
-            return {"below": value}
-        return {"above": value}
+        # Indexed by the result of `value < threshold`
+        return {("above", "below")[value < threshold]: value}
@@ -2,10 +2,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from typing import Any, Dict, List, Optional
+from unittest.mock import patch
 from jinja2 import TemplateSyntaxError
 import pytest
 
-from haystack.components.builders.prompt_builder import PromptBuilder
+from haystack.components.builders.prompt_builder import RUNTIME_TEMPLATE_CACHE_SIZE, PromptBuilder
 from haystack import component
 from haystack.core.pipeline.pipeline import Pipeline
 from haystack.dataclasses.document import Document
@@ -118,6 +119,15 @@ class TestPromptBuilder:
         res = builder.run()
         assert res == {"prompt": "This is a template without input"}
 
+    def test_run_static_template_is_rendered_once(self):
+        builder = PromptBuilder(template="This is a template without input\n")
+        with patch.object(builder.template, "render") as mock_render:
+            assert builder.run() == {"prompt": "This is a template without input"}
+            assert builder.run(template_variables={"foo": "bar"}) == {"prompt": "This is a template without input"}
+            mock_render.assert_not_called()
+
+        assert builder.run(template="This is {{ foo }}", foo="dynamic") == {"prompt": "This is dynamic"}
+
     def test_run_with_missing_input(self):
         builder = PromptBuilder(template="This is a {{ variable }}")
         res = builder.run()
@@ -175,6 +185,43 @@ class TestPromptBuilder:
 
         assert builder.run(template, name="John", var1="Big") == expected_result
 
+    def test_run_with_default_template_as_input_does_not_recompile(self):
+        default_template = "Hello, {{ name }}!"
+        builder = PromptBuilder(template=default_template)
+
+        with patch.object(builder._env, "compile") as mock_compile:
+            assert builder.run(default_template, name="John") == {"prompt": "Hello, John!"}
+            mock_compile.assert_not_called()
+
+    def test_run_with_template_as_input_compiles_it_once(self):
+        builder = PromptBuilder(template="Hello, {{ name }}!")
+        template = "Goodbye, {{ name }}!"
+
+        with patch.object(builder._env, "compile", wraps=builder._env.compile) as mock_compile:
+            assert builder.run(template, name="John") == {"prompt": "Goodbye, John!"}
+            assert builder.run(template, name="Jane") == {"prompt": "Goodbye, Jane!"}
+            assert mock_compile.call_count == 1
+
+    def test_run_with_template_as_input_cache_is_bounded(self):
+        builder = PromptBuilder(template="Hello, {{ name }}!")
+
+        for i in range(RUNTIME_TEMPLATE_CACHE_SIZE + 1):
+            assert builder.run(f"{i}: {{{{ name }}}}", name="John") == {"prompt": f"{i}: John"}
+
+        assert len(builder._runtime_templates) == RUNTIME_TEMPLATE_CACHE_SIZE
+        assert "0: {{ name }}" not in builder._runtime_templates
+
+    @pytest.mark.parametrize(
+        "template", ["Answer: {% include query %}", "Answer: {% import query as q %}", "{% extends query %}"]
+    )
+    def test_run_does_not_load_templates_from_inputs(self, template):
+        builder = PromptBuilder(template=template)
+
+        with pytest.raises(TypeError, match="no loader"):
+            builder.run(query="{{ 7*7 }}")
+        with pytest.raises(TypeError, match="no loader"):
+            builder.run(template=template, query="{{ 7*7 }}")
+
     def test_run_with_invalid_template(self):
         builder = PromptBuilder(template="Hello, {{ name }}!")
 
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import copy
+import pickle
 from typing import List
 from unittest import mock
 
@@ -103,6 +104,65 @@ class TestRouter:
         result = router.run(**kwargs)
         assert result == {"query": "test"}
 
+    def test_router_compiles_templates_once(self, router):
+        with mock.patch.object(router._env, "compile", wraps=router._env.compile) as mock_compile:
+            assert router.run(streams=[1, 2, 3], query="test") == {"streams": [1, 2, 3]}
+            assert router.run(streams=[4, 5], query="test") == {"streams": [4, 5]}
+            # Both conditions and the output of the second route
+            assert mock_compile.call_count == 3
+
+    def test_router_can_be_copied_and_pickled_after_running(self, router):
+        assert router.run(streams=[1, 2, 3], query="test") == {"streams": [1, 2, 3]}
+
+        copied = copy.deepcopy(router)
+        assert copied._compiled_templates == {}
+        assert copied.run(streams=[1], query="test") == {"query": "test"}
+
+        unpickled = pickle.loads(pickle.dumps(router))
+        assert unpickled.run(streams=[1, 2], query="test") == {"streams": [1, 2]}
+
+        # The original keeps its compiled templates
+        assert router._compiled_templates
+
+    def test_router_with_equality_conditions_looks_up_the_route(self):
+        routes = [
+            {
+                "condition": "{{ replies == ['Rome'] }}",
+                "output": "{{ replies }}",
+                "output_type": str,
+                "output_name": "a",
+            },
+            {"condition": "{{replies == ['Paris']}}", "output": "{{ query }}", "output_type": str, "output_name": "b"},
+            {"condition": "{{ replies == ['Rome'] }}", "output": "{{ query }}", "output_type": str, "output_name": "c"},
+        ]
+        router = ConditionalRouter(routes)
+
+        with mock.patch.object(router._env, "compile", wraps=router._env.compile) as mock_compile:
+            assert router.run(replies=["Paris"], query="test") == {"b": "test"}
+            assert router.run(replies=["Rome"], query="test") == {"a": ["Rome"]}
+            # Only the outputs are compiled, the conditions are never evaluated
+            assert mock_compile.call_count == 2
+
+        # Values that aren't in the table, or can't be looked up in it, fall back to evaluating the conditions
+        with pytest.raises(NoRouteSelectedException):
+            router.run(replies=["Berlin"], query="test")
+        with pytest.raises(NoRouteSelectedException):
+            router.run(replies=("Rome",), query="test")
+
+    def test_router_with_mixed_conditions_evaluates_them_in_order(self):
+        routes = [
+            {"condition": "{{ query == 'test' }}", "output": "{{ query }}", "output_type": str, "output_name": "a"},
+            {
+                "condition": "{{ replies == ['Rome'] }}",
+                "output": "{{ replies }}",
+                "output_type": str,
+                "output_name": "b",
+            },
+        ]
+        router = ConditionalRouter(routes)
+        assert router._eq_table is None
+        assert router.run(replies=["Rome"], query="test") == {"a": "test"}
+
     def test_router_evaluate_condition_expressions_using_output_slot(self):
         routes = [
             {
@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 import logging
 from functools import partial
-from typing import Any
+from typing import Any, List
 
 import pytest
 
@@ -155,6 +155,19 @@ def test_output_types_decorator_with_compatible_type():
     assert comp.__haystack_output__._sockets_dict == {"value": OutputSocket("value", int)}
 
 
+def test_mutates_decorator():
+    @component
+    class MockComponent:
+        @component.mutates("value")
+        @component.output_types(value=int)
+        def run(self, value: List[int], other: List[int]):
+            return {"value": 1}
+
+    comp = MockComponent()
+    assert comp.run._mutated_inputs == frozenset({"value"})
+    assert comp.__haystack_output__._sockets_dict == {"value": OutputSocket("value", int)}
+
+
 def test_component_decorator_set_it_as_component():
     @component
     class MockComponent:
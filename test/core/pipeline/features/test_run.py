@@ -1,6 +1,5 @@
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
 
-from pytest_bdd import scenarios, given
 import pytest
 
 from haystack import Pipeline, Document, component
@@ -33,10 +32,11 @@ from haystack.testing.factory import component_class
 
 pytestmark = pytest.mark.integration
 
-scenarios("pipeline_run.feature")
+# A Pipeline, its inputs, the expected outputs and the expected order in which Components run.
+# Pipelines that must be run more than once have a list of inputs, outputs and orders instead.
+PipelineData = Tuple[Pipeline, Any, Any, List[Any]]
 
 
-@given("a pipeline that has no components", target_fixture="pipeline_data")
 def pipeline_that_has_no_components():
     pipeline = Pipeline()
     inputs = {}
@@ -44,7 +44,6 @@ def pipeline_that_has_no_components():
     return pipeline, inputs, expected_outputs, []
 
 
-@given("a pipeline that is linear", target_fixture="pipeline_data")
 def pipeline_that_is_linear():
     pipeline = Pipeline()
     pipeline.add_component("first_addition", AddFixedValue(add=2))
@@ -61,7 +60,6 @@ def pipeline_that_is_linear():
     )
 
 
-@given("a pipeline that has an infinite loop", target_fixture="pipeline_data")
 def pipeline_that_has_an_infinite_loop():
     def custom_init(self):
         component.set_input_type(self, "x", int)
@@ -77,7 +75,6 @@ def pipeline_that_has_an_infinite_loop():
     return pipe, {"first": {"x": 1}}, PipelineMaxLoops
 
 
-@given("a pipeline that is really complex with lots of components, forks, and loops", target_fixture="pipeline_data")
 def pipeline_complex():
     pipeline = Pipeline(max_loops_allowed=2)
     pipeline.add_component("greet_first", Greet(message="Hello, the value is {value}."))
@@ -167,7 +164,6 @@ def pipeline_complex():
     )
 
 
-@given("a pipeline that has a single component with a default input", target_fixture="pipeline_data")
 def pipeline_that_has_a_single_component_with_a_default_input():
     @component
     class WithDefault:
@@ -186,7 +182,6 @@ def pipeline_that_has_a_single_component_with_a_default_input():
     )
 
 
-@given("a pipeline that has two loops of identical lengths", target_fixture="pipeline_data")
 def pipeline_that_has_two_loops_of_identical_lengths():
     pipeline = Pipeline(max_loops_allowed=10)
     pipeline.add_component("multiplexer", Multiplexer(type_=int))
@@ -226,7 +221,6 @@ def pipeline_that_has_two_loops_of_identical_lengths():
     )
 
 
-@given("a pipeline that has two loops of different lengths", target_fixture="pipeline_data")
 def pipeline_that_has_two_loops_of_different_lengths():
     pipeline = Pipeline(max_loops_allowed=10)
     pipeline.add_component("multiplexer", Multiplexer(type_=int))
@@ -268,7 +262,6 @@ def pipeline_that_has_two_loops_of_different_lengths():
     )
 
 
-@given("a pipeline that has a single loop with two conditional branches", target_fixture="pipeline_data")
 def pipeline_that_has_a_single_loop_with_two_conditional_branches():
     accumulator = Accumulate()
     pipeline = Pipeline(max_loops_allowed=10)
@@ -312,7 +305,6 @@ def pipeline_that_has_a_single_loop_with_two_conditional_branches():
     )
 
 
-@given("a pipeline that has a component with dynamic inputs defined in init", target_fixture="pipeline_data")
 def pipeline_that_has_a_component_with_dynamic_inputs_defined_in_init():
     pipeline = Pipeline()
     pipeline.add_component("hello", Hello())
@@ -332,7 +324,6 @@ def pipeline_that_has_a_component_with_dynamic_inputs_defined_in_init():
     )
 
 
-@given("a pipeline that has two branches that don't merge", target_fixture="pipeline_data")
 def pipeline_that_has_two_branches_that_dont_merge():
     pipeline = Pipeline()
     pipeline.add_component("add_one", AddFixedValue(add=1))
@@ -354,7 +345,6 @@ def pipeline_that_has_two_branches_that_dont_merge():
     )
 
 
-@given("a pipeline that has three branches that don't merge", target_fixture="pipeline_data")
 def pipeline_that_has_three_branches_that_dont_merge():
     pipeline = Pipeline()
     pipeline.add_component("add_one", AddFixedValue(add=1))
@@ -378,7 +368,6 @@ def pipeline_that_has_three_branches_that_dont_merge():
     )
 
 
-@given("a pipeline that has two branches that merge", target_fixture="pipeline_data")
 def pipeline_that_has_two_branches_that_merge():
     pipeline = Pipeline()
     pipeline.add_component("first_addition", AddFixedValue(add=2))
@@ -399,9 +388,6 @@ def pipeline_that_has_two_branches_that_merge():
     )
 
 
-@given(
-    "a pipeline that has different combinations of branches that merge and do not merge", target_fixture="pipeline_data"
-)
 def pipeline_that_has_different_combinations_of_branches_that_merge_and_do_not_merge():
     pipeline = Pipeline()
     pipeline.add_component("add_one", AddFixedValue())
@@ -436,7 +422,6 @@ def pipeline_that_has_different_combinations_of_branches_that_merge_and_do_not_m
     )
 
 
-@given("a pipeline that has two branches, one of which loops back", target_fixture="pipeline_data")
 def pipeline_that_has_two_branches_one_of_which_loops_back():
     pipeline = Pipeline(max_loops_allowed=10)
     pipeline.add_component("add_zero", AddFixedValue(add=0))
@@ -477,7 +462,6 @@ def pipeline_that_has_two_branches_one_of_which_loops_back():
     )
 
 
-@given("a pipeline that has a component with mutable input", target_fixture="pipeline_data")
 def pipeline_that_has_a_component_with_mutable_input():
     @component
     class InputMangler:
@@ -504,7 +488,6 @@ def pipeline_that_has_a_component_with_mutable_input():
     )
 
 
-@given("a pipeline that has a component with mutable output sent to multiple inputs", target_fixture="pipeline_data")
 def pipeline_that_has_a_component_with_mutable_output_sent_to_multiple_inputs():
     @component
     class PassThroughPromptBuilder:
@@ -515,9 +498,10 @@ def pipeline_that_has_a_component_with_mutable_output_sent_to_multiple_inputs():
 
     @component
     class MessageMerger:
+        @component.mutates()
         @component.output_types(merged_message=str)
         def run(self, messages: List[ChatMessage], metadata: dict = None):
-            return {"merged_message": "\n".join(t.content for t in messages)}
+            return {"merged_message": "\n".join([t.content for t in messages])}
 
     @component
     class FakeGenerator:
@@ -560,10 +544,6 @@ def pipeline_that_has_a_component_with_mutable_output_sent_to_multiple_inputs():
     )
 
 
-@given(
-    "a pipeline that has a greedy and variadic component after a component with default input",
-    target_fixture="pipeline_data",
-)
 def pipeline_that_has_a_greedy_and_variadic_component_after_a_component_with_default_input():
     """
     This test verifies that `Pipeline.run()` executes the components in the correct order when
@@ -597,7 +577,6 @@ def pipeline_that_has_a_greedy_and_variadic_component_after_a_component_with_def
     )
 
 
-@given("a pipeline that has a component that doesn't return a dictionary", target_fixture="pipeline_data")
 def pipeline_that_has_a_component_that_doesnt_return_a_dictionary():
     BrokenComponent = component_class(
         "BrokenComponent", input_types={"a": int}, output_types={"b": int}, output=1  # type:ignore
@@ -608,10 +587,6 @@ def pipeline_that_has_a_component_that_doesnt_return_a_dictionary():
     return pipe, {"comp": {"a": 1}}, PipelineRuntimeError
 
 
-@given(
-    "a pipeline that has components added in a different order from the order of execution",
-    target_fixture="pipeline_data",
-)
 def pipeline_that_has_components_added_in_a_different_order_from_the_order_of_execution():
     """
     We enqueue the Components in internal `to_run` data structure at the start of `Pipeline.run()` using the order
@@ -658,7 +633,6 @@ def pipeline_that_has_components_added_in_a_different_order_from_the_order_of_ex
     )
 
 
-@given("a pipeline that has a component with only default inputs", target_fixture="pipeline_data")
 def pipeline_that_has_a_component_with_only_default_inputs():
     FakeGenerator = component_class(
         "FakeGenerator", input_types={"prompt": str}, output_types={"replies": List[str]}, output={"replies": ["Paris"]}
@@ -717,7 +691,6 @@ def pipeline_that_has_a_component_with_only_default_inputs():
     )
 
 
-@given("a pipeline that has a component with only default inputs as first to run", target_fixture="pipeline_data")
 def pipeline_that_has_a_component_with_only_default_inputs_as_first_to_run():
     """
     This tests verifies that a Pipeline doesn't get stuck running in a loop if
@@ -787,10 +760,6 @@ def pipeline_that_has_a_component_with_only_default_inputs_as_first_to_run():
     )
 
 
-@given(
-    "a pipeline that has only a single component that sends one of its outputs to itself",
-    target_fixture="pipeline_data",
-)
 def pipeline_that_has_a_single_component_that_send_one_of_outputs_to_itself():
     pipeline = Pipeline(max_loops_allowed=10)
     pipeline.add_component("self_loop", SelfLoop())
@@ -804,7 +773,6 @@ def pipeline_that_has_a_single_component_that_send_one_of_outputs_to_itself():
     )
 
 
-@given("a pipeline that has a component that sends one of its outputs to itself", target_fixture="pipeline_data")
 def pipeline_that_has_a_component_that_sends_one_of_its_outputs_to_itself():
     pipeline = Pipeline(max_loops_allowed=10)
     pipeline.add_component("add_1", AddFixedValue())
@@ -822,10 +790,6 @@ def pipeline_that_has_a_component_that_sends_one_of_its_outputs_to_itself():
     )
 
 
-@given(
-    "a pipeline that has multiple branches that merge into a component with a single variadic input",
-    target_fixture="pipeline_data",
-)
 def pipeline_that_has_multiple_branches_that_merge_into_a_component_with_a_single_variadic_input():
     pipeline = Pipeline()
     pipeline.add_component("add_one", AddFixedValue())
@@ -854,10 +818,6 @@ def pipeline_that_has_multiple_branches_that_merge_into_a_component_with_a_singl
     )
 
 
-@given(
-    "a pipeline that has multiple branches of different lengths that merge into a component with a single variadic input",
-    target_fixture="pipeline_data",
-)
 def pipeline_that_has_multiple_branches_of_different_lengths_that_merge_into_a_component_with_a_single_variadic_input():
     pipeline = Pipeline()
     pipeline.add_component("first_addition", AddFixedValue(add=2))
@@ -878,3 +838,78 @@ def pipeline_that_has_multiple_branches_of_different_lengths_that_merge_into_a_c
         {"fourth_addition": {"result": 12}},
         ["first_addition", "second_addition", "third_addition", "sum", "fourth_addition"],
     )
+
+
+def run_pipeline(pipeline_data: PipelineData, spying_tracer) -> Tuple[List[Any], List[Any], List[Any], List[Any]]:
+    """
+    Runs a pipeline with the given inputs.
+
+    Returns a tuple of the run outputs, the expected outputs, the actual orders of execution
+    and the expected ones. A single run is normalized as a list of one run.
+    """
+    pipeline, inputs, expected_outputs, expected_order = pipeline_data
+
+    if not isinstance(inputs, list):
+        inputs = [inputs]
+        expected_outputs = [expected_outputs]
+        expected_order = [expected_order]
+
+    results = []
+    run_orders = []
+    for i in inputs:
+        results.append(pipeline.run(i))
+        run_orders.append(
+            [
+                span.tags["haystack.component.name"]
+                for span in spying_tracer.spans
+                if "haystack.component.name" in span.tags
+            ]
+        )
+        spying_tracer.spans.clear()
+    return results, expected_outputs, run_orders, expected_order
+
+
+@pytest.mark.parametrize(
+    "pipeline_factory",
+    [
+        pipeline_that_has_no_components,
+        pipeline_that_is_linear,
+        pipeline_complex,
+        pipeline_that_has_a_single_component_with_a_default_input,
+        pipeline_that_has_two_loops_of_identical_lengths,
+        pipeline_that_has_two_loops_of_different_lengths,
+        pipeline_that_has_a_single_loop_with_two_conditional_branches,
+        pipeline_that_has_a_component_with_dynamic_inputs_defined_in_init,
+        pipeline_that_has_two_branches_that_dont_merge,
+        pipeline_that_has_three_branches_that_dont_merge,
+        pipeline_that_has_two_branches_that_merge,
+        pipeline_that_has_different_combinations_of_branches_that_merge_and_do_not_merge,
+        pipeline_that_has_two_branches_one_of_which_loops_back,
+        pipeline_that_has_a_component_with_mutable_input,
+        pipeline_that_has_a_component_with_mutable_output_sent_to_multiple_inputs,
+        pipeline_that_has_a_greedy_and_variadic_component_after_a_component_with_default_input,
+        pipeline_that_has_components_added_in_a_different_order_from_the_order_of_execution,
+        pipeline_that_has_a_component_with_only_default_inputs,
+        pipeline_that_has_a_component_with_only_default_inputs_as_first_to_run,
+        pipeline_that_has_a_single_component_that_send_one_of_outputs_to_itself,
+        pipeline_that_has_a_component_that_sends_one_of_its_outputs_to_itself,
+        pipeline_that_has_multiple_branches_that_merge_into_a_component_with_a_single_variadic_input,
+        pipeline_that_has_multiple_branches_of_different_lengths_that_merge_into_a_component_with_a_single_variadic_input,
+    ],
+    ids=lambda factory: factory.__name__,
+)
+def test_running_a_correct_pipeline(pipeline_factory, spying_tracer):
+    results, expected_outputs, run_orders, expected_orders = run_pipeline(pipeline_factory(), spying_tracer)
+    assert results == expected_outputs
+    assert run_orders == expected_orders
+
+
+@pytest.mark.parametrize(
+    "pipeline_factory",
+    [pipeline_that_has_an_infinite_loop, pipeline_that_has_a_component_that_doesnt_return_a_dictionary],
+    ids=lambda factory: factory.__name__,
+)
+def test_running_a_bad_pipeline(pipeline_factory):
+    pipeline, inputs, expected_exception = pipeline_factory()
+    with pytest.raises(expected_exception):
+        pipeline.run(inputs)
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import logging
+from enum import Enum
 from typing import List, Optional
 from unittest.mock import patch
 
@@ -11,7 +12,7 @@ from haystack.components.builders import PromptBuilder
 from haystack.components.others import Multiplexer
 from haystack.core.component import component
 from haystack.core.component.types import InputSocket, OutputSocket, Variadic
-from haystack.core.errors import PipelineConnectError, PipelineDrawingError, PipelineError
+from haystack.core.errors import ComponentError, PipelineConnectError, PipelineDrawingError, PipelineError
 from haystack.core.pipeline import Pipeline, PredefinedPipeline
 from haystack.core.serialization import DeserializationCallbacks
 from haystack.testing.factory import component_class
@@ -119,6 +120,20 @@ class TestPipeline:
         with pytest.raises(PipelineError):
             second_pipe.add_component("some", some_component)
 
+    # UNIT
+    def test_add_component_and_connect_with_str_subclass_names(self):
+        class Names(str, Enum):
+            FIRST = "first"
+            DOUBLE = "double"
+
+        pipe = Pipeline()
+        pipe.add_component(Names.FIRST, AddFixedValue())
+        pipe.add_component(Names.DOUBLE, Double())
+        pipe.connect(Names.FIRST, Names.DOUBLE)
+
+        assert list(pipe.graph.nodes) == ["first", "double"]
+        assert pipe.run({"first": {"value": 1}}) == {"double": {"value": 4}}
+
     # UNIT
     def test_get_component_name(self):
         pipe = Pipeline()
@@ -707,6 +722,20 @@ class TestPipeline:
         assert to_run[2][0] == "with_single_input"
         assert to_run[3][0] == "with_multiple_inputs"
 
+    def test__get_schedule_is_cached_until_graph_changes(self):
+        pipe = Pipeline()
+        pipe.add_component("first", AddFixedValue())
+        schedule = pipe._get_schedule()
+        assert pipe._get_schedule() is schedule
+
+        pipe.add_component("double", Double())
+        schedule = pipe._get_schedule()
+        assert list(schedule.keys()) == ["first", "double"]
+
+        pipe.connect("first", "double")
+        assert pipe._get_schedule() is not schedule
+        assert not pipe._get_schedule()["double"].runs_first
+
     def test__init_inputs_state(self):
         pipe = Pipeline()
         template = """
@@ -742,6 +771,100 @@ class TestPipeline:
         }
         assert id(res["first_mock"]["x"]) != id(res["second_mock"]["x"])
 
+    def test__prepare_component_input_data_only_copies_mutated_inputs(self):
+        @component
+        class ReadOnly:
+            @component.mutates()
+            @component.output_types(z=str)
+            def run(self, x: List[str]):
+                return {"z": ""}
+
+        @component
+        class MutatesX:
+            @component.mutates("x")
+            @component.output_types(z=str)
+            def run(self, x: List[str], y: List[str]):
+                return {"z": ""}
+
+        pipe = Pipeline()
+        pipe.add_component("read_only", ReadOnly())
+        pipe.add_component("mutates_x", MutatesX())
+
+        x, y = ["some data"], ["some other data"]
+        res = pipe._prepare_component_input_data({"x": x, "y": y})
+        assert res == {"read_only": {"x": x}, "mutates_x": {"x": x, "y": y}}
+        assert res["read_only"]["x"] is x
+        assert res["mutates_x"]["x"] is not x
+        assert res["mutates_x"]["y"] is y
+
+    def test_run_only_deep_copies_mutated_inputs(self):
+        received = {}
+
+        @component
+        class ReadOnly:
+            @component.mutates()
+            @component.output_types(z=str)
+            def run(self, x: List[List[str]]):
+                received["read_only"] = x
+                return {"z": ""}
+
+        @component
+        class MutatesX:
+            @component.mutates("x")
+            @component.output_types(z=str)
+            def run(self, x: List[List[str]]):
+                received["mutates_x"] = x
+                return {"z": ""}
+
+        pipe = Pipeline()
+        pipe.add_component("read_only", ReadOnly())
+        pipe.add_component("mutates_x", MutatesX())
+
+        x = [["some data"]]
+        pipe.run({"read_only": {"x": x}, "mutates_x": {"x": x}})
+
+        # Inputs that are not mutated are not deep-copied, but still shallow copied
+        assert received["read_only"] == x
+        assert received["read_only"] is not x
+        assert received["read_only"][0] is x[0]
+        assert received["mutates_x"] == x
+        assert received["mutates_x"][0] is not x[0]
+
+    def test_run_shallow_copies_variadic_inputs_that_are_not_mutated(self):
+        received = {}
+
+        @component
+        class ReadOnlyVariadic:
+            @component.mutates()
+            @component.output_types(z=str)
+            def run(self, xs: Variadic[List[List[str]]]):
+                received["xs"] = xs
+                return {"z": ""}
+
+        pipe = Pipeline()
+        pipe.add_component("read_only", ReadOnlyVariadic())
+
+        x = [["some data"]]
+        pipe.run({"read_only": {"xs": x}})
+
+        assert received["xs"] == [x]
+        assert received["xs"][0] is not x
+        assert received["xs"][0][0] is x[0]
+
+    def test_run_with_unknown_mutated_input(self):
+        @component
+        class MutatesTypo:
+            @component.mutates("valu")
+            @component.output_types(z=str)
+            def run(self, value: List[str]):
+                return {"z": ""}
+
+        pipe = Pipeline()
+        pipe.add_component("typo", MutatesTypo())
+
+        with pytest.raises(ComponentError, match="valu"):
+            pipe.run({"typo": {"value": ["some data"]}})
+
     def test__prepare_component_input_data_with_connected_inputs(self):
         MockComponent = component_class(
             "MockComponent", input_types={"x": List[str], "y": str}, output_types={"z": str}
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+from haystack.components.others import Multiplexer
+from haystack.core.pipeline import Pipeline
+from haystack.core.pipeline.schedule import build_schedule
+from haystack.testing.sample_components import AddFixedValue, Double, SelfLoop, Sum, Threshold
+
+
+def test_build_schedule_linear_pipeline():
+    pipe = Pipeline()
+    pipe.add_component("first", AddFixedValue())
+    pipe.add_component("double", Double())
+    pipe.add_component("second", AddFixedValue())
+    pipe.connect("first", "double")
+    pipe.connect("double", "second")
+
+    schedule = build_schedule(pipe.graph)
+
+    assert list(schedule.keys()) == ["first", "double", "second"]
+    assert [(e[0], e[1], e[2].name, e[3].name) for e in schedule["first"].edges] == [
+        ("first", "double", "result", "value")
+    ]
+    assert schedule["second"].edges == ()
+    assert schedule["first"].runs_first
+    # `AddFixedValue.add` is not connected, so every AddFixedValue can run first
+    assert schedule["second"].runs_first
+    assert not schedule["double"].runs_first
+    assert schedule["double"].input_spec == {"value": {"type": "int", "senders": ["first"]}}
+    assert schedule["double"].output_spec == {"value": {"type": "int", "senders": ["second"]}}
+    assert schedule["first"].open_inputs == ("value", "add")
+    assert schedule["first"].required_inputs == ("value",)
+    assert schedule["second"].open_inputs == ("add",)
+    assert schedule["second"].required_inputs == ()
+    assert schedule["second"].connected_inputs == ("value",)
+
+
+def test_build_schedule_includes_incoming_variadic_edges():
+    pipe = Pipeline()
+    pipe.add_component("first", AddFixedValue())
+    pipe.add_component("second", AddFixedValue())
+    pipe.add_component("sum", Sum())
+    pipe.connect("first", "sum")
+    pipe.connect("second", "sum")
+
+    schedule = build_schedule(pipe.graph)
+
+    assert [(e[0], e[1]) for e in schedule["sum"].edges] == [("first", "sum"), ("second", "sum")]
+    assert schedule["sum"].is_variadic
+    assert not schedule["sum"].is_greedy
+
+
+def test_build_schedule_loops():
+    pipe = Pipeline(max_loops_allowed=10)
+    pipe.add_component("add_one", AddFixedValue())
+    pipe.add_component("multiplexer", Multiplexer(type_=int))
+    pipe.add_component("below_10", Threshold(threshold=10))
+    pipe.add_component("double", Double())
+    pipe.add_component("self_loop", SelfLoop())
+    pipe.connect("add_one", "multiplexer")
+    pipe.connect("multiplexer", "below_10")
+    pipe.connect("below_10.below", "double")
+    pipe.connect("double", "multiplexer")
+    pipe.connect("below_10.above", "self_loop")
+    pipe.connect("self_loop.current_value", "self_loop.values")
+
+    schedule = build_schedule(pipe.graph)
+
+    assert schedule["multiplexer"].is_greedy
+    # The self loop edge is listed only once
+    assert [(e[0], e[1]) for e in schedule["self_loop"].edges] == [
+        ("below_10", "self_loop"),
+        ("self_loop", "self_loop"),
+    ]
@@ -1,9 +1,28 @@
 # SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import sys
+from enum import Enum
+
 from haystack.core.pipeline.utils import parse_connect_string
 
 
 def test_parse_connection():
     assert parse_connect_string("foobar") == ("foobar", None)
     assert parse_connect_string("foo.bar") == ("foo", "bar")
+
+
+def test_parse_connect_string_interns_names():
+    component_name, socket_name = parse_connect_string("".join(["foo", ".", "bar"]))
+    assert component_name is sys.intern("foo")
+    assert socket_name is sys.intern("bar")
+
+
+def test_parse_connect_string_with_str_subclass():
+    class Names(str, Enum):
+        FIRST = "first"
+
+    component_name, socket_name = parse_connect_string(Names.FIRST)
+    assert type(component_name) is str
+    assert component_name is sys.intern("first")
+    assert socket_name is None
@@ -39,3 +39,28 @@ def test_fstring_with_vars_missing():
     fstring = FString(template="{greeting}, {name}!", variables=["name"])
     with pytest.raises(KeyError):
         fstring.run(greeting="Hello")
+
+
+def test_fstring_with_format_spec():
+    fstring = FString(template="{value:>5}|{value!r}|{{literal}}", variables=["value"])
+    output = fstring.run(value="a")
+    assert output == {"string": "    a|'a'|{literal}"}
+
+
+def test_fstring_with_escaped_braces():
+    fstring = FString(template="{{{name}}}", variables=["name"])
+    output = fstring.run(name="Alice")
+    assert output == {"string": "{Alice}"}
+
+
+def test_fstring_with_malformed_template():
+    fstring = FString(template="Hello {name", variables=["name"])
+    with pytest.raises(ValueError):
+        fstring.run(name="Alice")
+
+
+def test_fstring_with_template_reassigned():
+    fstring = FString(template="Hello, {name}!", variables=["name"])
+    fstring.template = "Goodbye, {name}!"
+    output = fstring.run(name="Alice")
+    assert output == {"string": "Goodbye, Alice!"}
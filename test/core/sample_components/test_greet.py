@@ -13,3 +13,16 @@ def test_greet_message(caplog):
     results = component.run(value=10, message="Hello, that's {value}", log_level="WARNING")
     assert results == {"value": 10}
     assert "Hello, that's 10" in caplog.text
+
+
+def test_greet_message_below_log_level_is_not_formatted(caplog):
+    class Unformattable:
+        def __format__(self, format_spec):
+            raise AssertionError("The message must not be formatted when it's not logged")
+
+    caplog.set_level(logging.WARNING)
+    component = Greet()
+    value = Unformattable()
+    results = component.run(value=value, message="Hello, that's {value}", log_level="INFO")
+    assert results == {"value": value}
+    assert "Hello, that's" not in caplog.text
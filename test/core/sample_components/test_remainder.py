@@ -22,3 +22,9 @@ def test_remainder_with_divisor():
 def test_remainder_zero():
     with pytest.raises(ValueError):
         Remainder(divisor=0)
+
+
+def test_remainder_with_negative_value():
+    component = Remainder(divisor=3)
+    results = component.run(value=-4)
+    assert results == {"remainder_is_2": -4}
@@ -1,6 +1,11 @@
 # SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import copyreg
+import pickle
+from copy import deepcopy
+
+import pytest
 from pandas import DataFrame
 
 from haystack.dataclasses.answer import Answer, ExtractedAnswer, ExtractedTableAnswer, GeneratedAnswer
@@ -269,3 +274,27 @@ class TestGeneratedAnswer:
             Document(id="3", content="42 is definitely the answer."),
         ]
         assert answer.meta == {"meta_key": "meta_value"}
+
+    def test_uses_slots(self):
+        answer = GeneratedAnswer(
+            data="42", query="What is the answer?", documents=[Document(id="1", content="The answer is 42.")], meta={}
+        )
+        assert not hasattr(answer, "__dict__")
+        with pytest.raises(AttributeError):
+            answer.unknown_field = "value"
+        assert pickle.loads(pickle.dumps(answer)) == answer
+        assert deepcopy(answer) == answer
+
+    def test_pickled_before_slots_can_be_loaded(self):
+        state = {
+            "data": "42",
+            "query": "What is the answer?",
+            "documents": [Document(id="1", content="The answer is 42.")],
+            "meta": {"meta_key": "meta_value"},
+        }
+
+        class LegacyGeneratedAnswer:
+            def __reduce__(self):
+                return copyreg._reconstructor, (GeneratedAnswer, object, None), state
+
+        assert pickle.loads(pickle.dumps(LegacyGeneratedAnswer())) == GeneratedAnswer(**state)
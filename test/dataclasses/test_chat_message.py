@@ -1,6 +1,10 @@
 # SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import copyreg
+import pickle
+from copy import deepcopy
+
 import pytest
 from transformers import AutoTokenizer
 
@@ -81,3 +85,22 @@ def test_apply_custom_chat_templating_on_chat_message():
         formatted_messages, chat_template=anthropic_template, tokenize=False
     )
     assert tokenized_messages == "You are good assistant\nHuman: I have a question\nAssistant:"
+
+
+def test_chat_message_uses_slots():
+    message = ChatMessage.from_user("I have a question.")
+    assert not hasattr(message, "__dict__")
+    with pytest.raises(AttributeError):
+        message.unknown_field = "value"
+    assert pickle.loads(pickle.dumps(message)) == message
+    assert deepcopy(message) == message
+
+
+def test_chat_message_pickled_before_slots_can_be_loaded():
+    state = {"content": "I have a question.", "role": ChatRole.USER, "name": None, "meta": {"key": "value"}}
+
+    class LegacyChatMessage:
+        def __reduce__(self):
+            return copyreg._reconstructor, (ChatMessage, object, None), state
+
+    assert pickle.loads(pickle.dumps(LegacyChatMessage())) == ChatMessage(**state)
@@ -1,6 +1,10 @@
 # SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import copyreg
+import pickle
+from copy import deepcopy
+
 import pandas as pd
 import pytest
 
@@ -307,3 +311,26 @@ def test_content_type():
 
     with pytest.raises(ValueError):
         _ = Document(content="text", dataframe=pd.DataFrame([0])).content_type
+
+
+def test_document_uses_slots():
+    doc = Document(content="test text", meta={"key": "value"})
+    assert not hasattr(doc, "__dict__")
+    with pytest.raises(AttributeError):
+        doc.unknown_field = "value"
+    assert pickle.loads(pickle.dumps(doc)) == doc
+    assert deepcopy(doc) == doc
+
+
+def test_document_pickled_before_slots_can_be_loaded():
+    doc = Document(content="test text", meta={"key": "value"})
+    state = {"id": doc.id, "content": "test text", "meta": {"key": "value"}, "score": None, "embedding": None}
+    state.update({"dataframe": None, "blob": None, "sparse_embedding": None})
+
+    class LegacyDocument:
+        # Reduces to what pickle produced for a Document without slots, whose state was its __dict__
+        def __reduce__(self):
+            return copyreg._reconstructor, (Document, object, None), state
+
+    assert pickle.loads(pickle.dumps(LegacyDocument())) == doc
+    assert doc.__reduce_ex__(pickle.DEFAULT_PROTOCOL)[2] == state
@@ -10,7 +10,9 @@ import pytest
 from haystack import Document
 from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
 from haystack.document_stores.in_memory import InMemoryDocumentStore
+from haystack.document_stores.in_memory.document_store import _top_k_by_score
 from haystack.testing.document_store import DocumentStoreBaseTests
+from haystack.document_stores.types import DuplicatePolicy
 
 
 class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
@@ -175,6 +177,53 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         assert len(results) == 1
         assert results[0].content == "Python is a popular programming language"
 
+    def test_bm25_retrieval_is_cached(self, document_store: InMemoryDocumentStore):
+        document_store.write_documents([Document(content="Python programming"), Document(content="Java programming")])
+
+        with patch.object(document_store, "bm25_algorithm_inst", wraps=document_store.bm25_algorithm_inst) as mock_bm25:
+            first = document_store.bm25_retrieval(query="Python", top_k=1)
+            second = document_store.bm25_retrieval(query="Python", top_k=1)
+            assert mock_bm25.call_count == 1
+            assert first == second
+            # Returned documents are never shared between calls
+            assert first[0] is not second[0]
+
+            document_store.bm25_retrieval(query="Python", top_k=2)
+            assert mock_bm25.call_count == 2
+
+            document_store.write_documents([Document(content="Python Python")])
+            results = document_store.bm25_retrieval(query="Python", top_k=1)
+            assert mock_bm25.call_count == 3
+            assert results[0].content == "Python Python"
+
+            document_store.delete_documents([results[0].id])
+            results = document_store.bm25_retrieval(query="Python", top_k=1)
+            assert mock_bm25.call_count == 4
+            assert results[0].content == "Python programming"
+
+    def test_bm25_retrieval_cache_is_invalidated_by_partial_write(self, document_store: InMemoryDocumentStore):
+        java = Document(content="Java programming")
+        document_store.write_documents([java])
+        assert [doc.content for doc in document_store.bm25_retrieval(query="Python programming")] == [
+            "Java programming"
+        ]
+
+        with pytest.raises(DuplicateDocumentError):
+            document_store.write_documents([Document(content="Python programming"), java], DuplicatePolicy.FAIL)
+
+        assert document_store.count_documents() == 2
+        results = document_store.bm25_retrieval(query="Python programming")
+        assert [doc.content for doc in results] == ["Python programming", "Java programming"]
+
+    def test_bm25_retrieval_with_filters_is_not_cached(self, document_store: InMemoryDocumentStore):
+        document_store.write_documents([Document(content="Python programming", meta={"lang": "en"})])
+
+        with patch.object(document_store, "bm25_algorithm_inst", wraps=document_store.bm25_algorithm_inst) as mock_bm25:
+            filters = {"field": "meta.lang", "operator": "==", "value": "en"}
+            document_store.bm25_retrieval(query="Python", filters=filters)
+            document_store.bm25_retrieval(query="Python", filters=filters)
+            assert mock_bm25.call_count == 2
+
     def test_bm25_retrieval_with_scale_score(self, document_store: InMemoryDocumentStore):
         docs = [Document(content="Python programming"), Document(content="Java programming")]
         document_store.write_documents(docs)
@@ -444,3 +493,21 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
 
         document_store_2.delete_documents([doc_1.id])
         assert document_store_1.count_documents() == document_store_2.count_documents() == 0
+
+
+class TestTopKByScore:
+    @pytest.fixture
+    def scored(self):
+        # Ties on purpose, to check they keep their insertion order
+        return [(Document(content=str(i)), score) for i, score in enumerate([0.5, 0.9, 0.5, 0.1, 0.9, 0.5])]
+
+    def test_ties_keep_insertion_order(self, scored):
+        assert [doc.content for doc, _ in _top_k_by_score(scored, 4)] == ["1", "4", "0", "2"]
+        assert _top_k_by_score(scored, len(scored)) == sorted(scored, key=lambda x: x[1], reverse=True)
+
+    def test_with_generator(self, scored):
+        assert _top_k_by_score(iter(scored), 2) == sorted(scored, key=lambda x: x[1], reverse=True)[:2]
+
+    @pytest.mark.parametrize("top_k", [0, None, -1, -4, 100])
+    def test_matches_sorted_slice(self, scored, top_k):
+        assert _top_k_by_score(scored, top_k) == sorted(scored, key=lambda x: x[1], reverse=True)[:top_k]